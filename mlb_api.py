@@ -3,46 +3,116 @@ MLB API module for fetching game data.
 Uses the free MLB Stats API.
 """
 
+import re
+import sys
+from types import MappingProxyType
+import orjson
 import requests
-import json
-from datetime import datetime, timezone, timedelta
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from stadium_coords import get_stadium_coordinates
 
+# Eastern Time, DST-aware (EDT is UTC-4, EST is UTC-5)
+EASTERN = ZoneInfo("America/New_York")
+
+# Game status groupings shared with the Streamlit app
+LIVE_STATUSES = frozenset({"In Progress", "Live"})
+FINAL_STATUSES = frozenset({"Final", "Game Over"})
+DELAYED_STATUSES = frozenset({"Delayed"})
+POSTPONED_STATUSES = frozenset({"Postponed"})
+STARTED_STATUSES = LIVE_STATUSES | FINAL_STATUSES
+
+# Shared read-only fallback for missing nested objects, so lookups don't allocate a new {}
+_EMPTY = MappingProxyType({})
+
+# Pulls the distance out of play descriptions like "... 412 feet."
+_HR_DISTANCE_RE = re.compile(r'(\d+)\s*feet')
+
+# Only the schedule fields _parse_game_data reads; the API drops everything else server-side
+_SCHEDULE_FIELDS = ",".join([
+    "dates", "games", "gamePk", "gameDate",
+    "status", "detailedState",
+    "teams", "away", "home", "team", "name", "abbreviation", "score",
+    "venue",
+    "linescore", "currentInning", "inningState", "homeRuns",
+])
+
+def _format_12h(dt):
+    """Format a datetime as a 12-hour clock time without a leading zero, e.g. "7:05 PM"."""
+    hour = dt.hour
+    am_pm = 'AM' if hour < 12 else 'PM'
+    return f"{hour % 12 or 12}:{dt.minute:02d} {am_pm}"
+
 class MLBGameFetcher:
     def __init__(self):
         self.base_url = "https://statsapi.mlb.com/api/v1"
+        
+        # Reuse one keep-alive connection for the schedule and all playByPlay calls
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+        
+        # Home runs for finished games, keyed by game_pk (they never change once final)
+        self._hr_cache = {}
     
     def get_todays_games(self):
         """
         Fetch today's MLB games.
-        Returns list of game dictionaries with relevant information.
+        Returns list of game dictionaries with relevant information,
+        or None if the schedule request failed (an empty list means no games today).
         """
         # Get today's date in Eastern Time to ensure we get the right games
-        eastern_tz = timezone(timedelta(hours=-4))  # EDT
-        today_eastern = datetime.now(eastern_tz)
+        today_eastern = datetime.now(EASTERN)
         today = today_eastern.strftime("%Y-%m-%d")
-        url = f"{self.base_url}/schedule?sportId=1&date={today}&hydrate=linescore"
+        url = (f"{self.base_url}/schedule?sportId=1&date={today}&hydrate=linescore"
+               f"&fields={_SCHEDULE_FIELDS}")
         
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             games = []
-            if 'dates' in data and len(data['dates']) > 0:
-                for game_data in data['dates'][0].get('games', []):
+            hr_games = []
+            dates = data.get('dates') or ()
+            if dates:
+                for game_data in dates[0].get('games', ()):
                     game_info = self._parse_game_data(game_data)
                     if game_info:
                         games.append(game_info)
+                        if self._needs_home_run_fetch(game_info, game_data):
+                            hr_games.append(game_info)
+            
+            # Finished games can't gain home runs, so reuse what we already fetched
+            to_fetch = []
+            for game in hr_games:
+                if game['status'] in FINAL_STATUSES and game['game_pk'] in self._hr_cache:
+                    game['home_runs'] = self._hr_cache[game['game_pk']]
+                else:
+                    to_fetch.append(game)
+            
+            # Fetch home runs for the remaining games concurrently
+            if to_fetch:
+                pks = [game['game_pk'] for game in to_fetch]
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    hr_map = dict(zip(pks, executor.map(self._get_home_runs_for_game, pks)))
+                for game in to_fetch:
+                    home_runs = hr_map[game['game_pk']]
+                    # A failed fetch shows as no home runs now but isn't cached, so it's retried next poll
+                    game['home_runs'] = home_runs if home_runs is not None else []
+                    if home_runs is not None and game['status'] in FINAL_STATUSES:
+                        self._hr_cache[game['game_pk']] = home_runs
             
             return games
             
         except requests.RequestException as e:
             print(f"Error fetching MLB data: {e}")
-            return []
-        except json.JSONDecodeError as e:
+            return None
+        except orjson.JSONDecodeError as e:
             print(f"Error parsing MLB data: {e}")
-            return []
+            return None
     
     def _parse_game_data(self, game_data):
         """
@@ -50,51 +120,52 @@ class MLBGameFetcher:
         """
         try:
             # Extract basic game info
-            away_team = game_data['teams']['away']['team']['name']
-            home_team = game_data['teams']['home']['team']['name']
-            away_team_abbr = game_data['teams']['away']['team'].get('abbreviation', '')
-            home_team_abbr = game_data['teams']['home']['team'].get('abbreviation', '')
+            teams = game_data['teams']
+            away, home = teams['away'], teams['home']
+            away_team_info, home_team_info = away['team'], home['team']
+            away_team = away_team_info['name']
+            home_team = home_team_info['name']
+            away_team_abbr = away_team_info.get('abbreviation', '')
+            home_team_abbr = home_team_info.get('abbreviation', '')
             game_pk = game_data.get('gamePk')
             
             # Get game status first
-            status = game_data.get('status', {}).get('detailedState', 'Scheduled')
+            status = (game_data.get('status') or _EMPTY).get('detailedState', 'Scheduled')
             
             # Get game time and convert to Eastern Time
             game_datetime = game_data.get('gameDate', '')
             if game_datetime:
-                # Convert from UTC to Eastern Time (EDT is UTC-4, EST is UTC-5)
-                dt_utc = datetime.fromisoformat(game_datetime.replace('Z', '+00:00'))
-                # Convert to Eastern Time (currently EDT in August)
-                dt_eastern = dt_utc.replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=-4)))
+                # Convert from UTC to Eastern Time (Python 3.11+ parses the trailing 'Z' natively)
+                dt_eastern = datetime.fromisoformat(game_datetime).astimezone(EASTERN)
                 
                 # Format time display based on game status
-                if status in ["In Progress", "Live"]:
+                if status in LIVE_STATUSES:
                     # For games in progress, show "LIVE"
                     game_time = "LIVE"
-                elif status in ["Final", "Game Over"]:
+                elif status in FINAL_STATUSES:
                     # For finished games, show "FINAL"
                     game_time = "FINAL"
-                elif status in ["Delayed"]:
+                elif status in DELAYED_STATUSES:
                     # For delayed games, show original time with status
-                    original_time = dt_eastern.strftime("%I:%M %p").lstrip('0')
+                    original_time = _format_12h(dt_eastern)
                     game_time = f"{original_time} (Delayed)"
-                elif status in ["Postponed"]:
+                elif status in POSTPONED_STATUSES:
                     game_time = "POSTPONED"
                 else:
                     # For scheduled games, show the Eastern start time
-                    game_time = dt_eastern.strftime("%I:%M %p").lstrip('0')
+                    game_time = _format_12h(dt_eastern)
             else:
                 game_time = "TBD"
             
             # Get score and inning information for live and final games
             score_info = ""
-            if status in ["In Progress", "Live"]:
+            if status in LIVE_STATUSES:
                 try:
-                    away_score = game_data['teams']['away'].get('score', 0)
-                    home_score = game_data['teams']['home'].get('score', 0)
+                    away_score = away.get('score', 0)
+                    home_score = home.get('score', 0)
                     
                     # Get inning information
-                    linescore = game_data.get('linescore', {})
+                    linescore = game_data.get('linescore') or _EMPTY
                     current_inning = linescore.get('currentInning', 1)
                     inning_state = linescore.get('inningState', 'Top')  # Top, Middle, Bottom
                     
@@ -107,25 +178,23 @@ class MLBGameFetcher:
                 except (KeyError, TypeError):
                     # If score data is not available
                     pass
-            elif status in ["Final", "Game Over"]:
+            elif status in FINAL_STATUSES:
                 try:
-                    away_score = game_data['teams']['away'].get('score', 0)
-                    home_score = game_data['teams']['home'].get('score', 0)
+                    away_score = away.get('score', 0)
+                    home_score = home.get('score', 0)
                     score_info = f" - Final: {away_score}-{home_score}"
                 except (KeyError, TypeError):
                     pass
             
             # Get venue information
-            venue = game_data.get('venue', {})
-            stadium_name = venue.get('name', 'Unknown Stadium')
+            venue = game_data.get('venue') or _EMPTY
+            stadium_name = sys.intern(venue.get('name') or 'Unknown Stadium')
             
             # Get coordinates for weather lookup
             coordinates = get_stadium_coordinates(stadium_name)
             
-            # Get home run information if available
+            # Home runs are filled in afterwards by get_todays_games
             home_runs_info = []
-            if game_pk and status in ["In Progress", "Live", "Final", "Game Over"]:
-                home_runs_info = self._get_home_runs_for_game(game_pk)
             
             return {
                 'away_team': away_team,
@@ -149,45 +218,63 @@ class MLBGameFetcher:
             print(f"Unexpected error parsing game data: {e}")
             return None
     
+    def _needs_home_run_fetch(self, game_info, game_data):
+        """
+        Decide whether a game's playByPlay is worth downloading for home runs.
+        Skips games that haven't started and games whose linescore reports no home runs.
+        """
+        if not game_info['game_pk'] or game_info['status'] not in STARTED_STATUSES:
+            return False
+        
+        # Only trust the linescore when it actually reports home run totals
+        linescore_teams = (game_data.get('linescore') or _EMPTY).get('teams') or _EMPTY
+        away_hrs = (linescore_teams.get('away') or _EMPTY).get('homeRuns')
+        home_hrs = (linescore_teams.get('home') or _EMPTY).get('homeRuns')
+        if away_hrs is not None and home_hrs is not None:
+            return away_hrs + home_hrs > 0
+        return True
+    
     def _get_home_runs_for_game(self, game_pk):
         """
         Fetch home run data for a specific game.
+        Returns a list of home runs, or None if the request failed.
         """
         try:
             url = f"{self.base_url}/game/{game_pk}/playByPlay"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            
+            # Most games have no home runs - skip decoding the large payload entirely
+            body = response.content
+            if b'"home_run"' not in body:
+                return []
+            data = orjson.loads(body)
             
             home_runs = []
-            plays = data.get('allPlays', [])
+            plays = data.get('allPlays', ())
             
             for play in plays:
-                result = play.get('result', {})
+                result = play.get('result') or _EMPTY
                 if result.get('eventType') == 'home_run':
                     # Get batter info
-                    batter = play.get('matchup', {}).get('batter', {})
+                    batter = (play.get('matchup') or _EMPTY).get('batter') or _EMPTY
                     batter_name = batter.get('fullName', 'Unknown')
                     
                     # Get team info
-                    batting_team = play.get('about', {}).get('halfInning', '')
+                    about = play.get('about') or _EMPTY
+                    batting_team = about.get('halfInning', '')
                     if batting_team == 'top':
                         team_type = 'away'
                     else:
                         team_type = 'home'
                     
                     # Get inning
-                    inning = play.get('about', {}).get('inning', 0)
+                    inning = about.get('inning', 0)
                     
                     # Get description for distance if available
                     description = result.get('description', '')
-                    distance = None
-                    if 'feet' in description:
-                        # Try to extract distance from description
-                        import re
-                        distance_match = re.search(r'(\d+)\s*feet', description)
-                        if distance_match:
-                            distance = int(distance_match.group(1))
+                    distance_match = _HR_DISTANCE_RE.search(description)
+                    distance = int(distance_match.group(1)) if distance_match else None
                     
                     home_runs.append({
                         'batter': batter_name,
@@ -201,7 +288,7 @@ class MLBGameFetcher:
             
         except Exception as e:
             print(f"Error fetching home run data for game {game_pk}: {e}")
-            return []
+            return None
 
 def test_mlb_api():
     """
@@ -209,6 +296,9 @@ def test_mlb_api():
     """
     fetcher = MLBGameFetcher()
     games = fetcher.get_todays_games()
+    if games is None:
+        print("Failed to fetch today's games")
+        return
     
     print(f"Found {len(games)} games today:")
     for game in games:
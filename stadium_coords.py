@@ -3,6 +3,8 @@ Stadium coordinates mapping for MLB teams.
 Maps stadium names to their latitude and longitude coordinates.
 """
 
+import sys
+
 # Stadium coordinates and orientations for MLB teams
 # Coordinates are (latitude, longitude)
 # Orientations are the bearing from home plate to center field in degrees
@@ -88,19 +90,29 @@ STADIUM_ORIENTATIONS = {
     "Oracle Park": 90,  # SW (unique orientation due to bay location)
 }
 
+# Combined ((lat, lon), bearing) per stadium so a single lookup serves both tables.
+# The (lat, lon) tuples are the ones stored above, so lookups return them without copying.
+# Names are interned so lookups with interned venue names compare by identity.
+STADIUMS = {
+    sys.intern(name): (coords, STADIUM_ORIENTATIONS.get(name))
+    for name, coords in STADIUM_COORDINATES.items()
+}
+
 def get_stadium_coordinates(stadium_name):
     """
     Get coordinates for a stadium name.
     Returns (lat, lon) tuple or None if not found.
     """
-    return STADIUM_COORDINATES.get(stadium_name)
+    stadium = STADIUMS.get(stadium_name)
+    return stadium[0] if stadium else None
 
 def get_stadium_orientation(stadium_name):
     """
     Get orientation (home plate to center field bearing) for a stadium.
     Returns bearing in degrees or None if not found.
     """
-    return STADIUM_ORIENTATIONS.get(stadium_name)
+    stadium = STADIUMS.get(stadium_name)
+    return stadium[1] if stadium else None
 
 def get_all_stadiums():
     """
@@ -6,12 +6,20 @@ Clean, mobile-friendly web interface for easy deployment and sharing.
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timezone, timedelta
+import cachetools
+import diskcache
+from datetime import datetime
 import os
+import functools
+import re
 import time
+import threading
+import tempfile
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from mlb_api import MLBGameFetcher
+from mlb_api import MLBGameFetcher, EASTERN, LIVE_STATUSES, FINAL_STATUSES, STARTED_STATUSES
 from weather_api import WeatherFetcher, get_mock_weather
 
 # Page configuration
@@ -23,245 +31,143 @@ st.set_page_config(
 )
 
 # Enhanced CSS for better mobile experience and cleaner styling
-st.markdown("""
-<style>
-    .main-header {
-        text-align: center;
-        padding: 1.5rem 0;
-        background: linear-gradient(135deg, #1f4e79, #2e86ab, #a23b72);
-        color: white;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    
-    .main-header h1 {
-        margin: 0;
-        font-size: 2.5rem;
-        font-weight: 700;
-    }
-    
-    .main-header p {
-        margin: 0.5rem 0 0 0;
-        opacity: 0.9;
-        font-size: 1.1rem;
-    }
-    
-    .game-card {
-        border: 1px solid #e0e0e0;
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        background: white;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-    
-    .game-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0,0,0,0.12);
-    }
-    
-    .live-game {
-        border-left: 6px solid #ff4444;
-        background: linear-gradient(135deg, #fff5f5, #ffffff);
-        animation: pulse-border 2s infinite;
-    }
-    
-    @keyframes pulse-border {
-        0%, 100% { border-left-color: #ff4444; }
-        50% { border-left-color: #ff6666; }
-    }
-    
-    .final-game {
-        border-left: 6px solid #28a745;
-        background: linear-gradient(135deg, #f8fff8, #ffffff);
-    }
-    
-    .delayed-game {
-        border-left: 6px solid #ff8800;
-        background: linear-gradient(135deg, #fff8f0, #ffffff);
-    }
-    
-    .scheduled-game {
-        border-left: 6px solid #007bff;
-        background: linear-gradient(135deg, #f0f8ff, #ffffff);
-    }
-    
-    .weather-info {
-        background: linear-gradient(135deg, #f0f8ff, #e6f3ff);
-        padding: 1rem;
-        border-radius: 12px;
-        margin-top: 1rem;
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        font-size: 0.95rem;
-        color: #2c3e50;
-        border: 1px solid #d6e9ff;
-    }
-    
-    .home-runs-info {
-        background: linear-gradient(135deg, #fff8e1, #fffbf0);
-        padding: 1rem;
-        border-radius: 12px;
-        margin-top: 1rem;
-        border: 1px solid #ffd54f;
-        color: #e65100;
-    }
-    
-    .home-run-item {
-        background: rgba(255, 193, 7, 0.1);
-        padding: 0.5rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        border-left: 3px solid #ffc107;
-    }
-    
-    .game-time {
-        font-weight: 700;
-        font-size: 1.2rem;
-        color: #2c3e50;
-    }
-    
-    .live-indicator {
-        color: #ff4444;
-        font-weight: 700;
-        animation: blink 1.5s infinite;
-        text-shadow: 0 0 5px rgba(255, 68, 68, 0.5);
-    }
-    
-    @keyframes blink {
-        0%, 50% { opacity: 1; }
-        51%, 100% { opacity: 0.7; }
-    }
-    
-    .score {
-        color: #dc3545;
-        font-weight: 700;
-        font-size: 1.1rem;
-    }
-    
-    .final-score {
-        color: #28a745;
-        font-weight: 700;
-        font-size: 1.1rem;
-    }
-    
-    .team-names {
-        font-size: 1.3rem;
-        font-weight: 600;
-        color: #2c3e50;
-        margin-bottom: 0.5rem;
-    }
-    
-    .stadium-info {
-        color: #6c757d;
-        font-size: 1rem;
-        margin: 0.5rem 0;
-    }
-    
-    .metrics-container {
-        background: linear-gradient(135deg, #f8f9fa, #ffffff);
-        padding: 1rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-    }
-    
-    .footer-info {
-        text-align: center;
-        color: #6c757d;
-        font-size: 0.9rem;
-        background: linear-gradient(135deg, #f8f9fa, #ffffff);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin-top: 2rem;
-    }
-    
-    .cache-info {
-        background: linear-gradient(135deg, #e8f5e8, #f0fff0);
-        padding: 0.5rem;
-        border-radius: 8px;
-        border: 1px solid #c3e6c3;
-        font-size: 0.85rem;
-        color: #2d5a2d;
-    }
-    
-    /* Mobile responsiveness */
-    @media (max-width: 768px) {
-        .main-header h1 {
-            font-size: 2rem;
-        }
-        
-        .game-card {
-            padding: 1rem;
-        }
-        
-        .team-names {
-            font-size: 1.1rem;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "styles.css")
+
+@st.cache_resource(show_spinner=False)
+def load_css():
+    """Read and minify the app stylesheet once per process - it's resent on every rerun."""
+    with open(CSS_PATH, encoding="utf-8") as css_file:
+        css = css_file.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)  # Drop comments
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css)  # No spaces around punctuation
+    css = re.sub(r'\s+', ' ', css).strip()
+    return f"<style>{css}</style>"
+
+st.markdown(load_css(), unsafe_allow_html=True)
 
 def get_cache_ttl():
     """Get cache TTL based on Eastern Time - no refresh between 3am-10am."""
-    eastern_tz = timezone(timedelta(hours=-4))  # EDT
-    eastern_time = datetime.now(eastern_tz)
+    eastern_time = datetime.now(EASTERN)
     current_hour = eastern_time.hour
     
-    # During quiet hours (3am-10am Eastern), use very long cache (7 hours)
+    # During quiet hours (3am-10am Eastern), hold the cache until 10am
     if 3 <= current_hour < 10:
-        return 25200  # 7 hours in seconds
+        quiet_hours_end = eastern_time.replace(hour=10, minute=0, second=0, microsecond=0)
+        return (quiet_hours_end - eastern_time).total_seconds()
     else:
-        return 1800  # 30 minutes in seconds during active hours
+        return GAMES_CACHE_TTL  # Normal games refresh during active hours
+
+@st.cache_resource(show_spinner=False)
+def get_mlb_fetcher():
+    """Shared MLB fetcher so its HTTP session and final-game home run cache survive reruns."""
+    return MLBGameFetcher()
+
+@st.cache_resource(show_spinner=False)
+def get_weather_api_key():
+    """Read the OpenWeather API key once per process - secrets don't change while running."""
+    try:
+        api_key = st.secrets.get("OPENWEATHER_API_KEY", None)
+    except FileNotFoundError:
+        # No secrets.toml (e.g. local dev) - fall back to the environment
+        api_key = None
+    return api_key or os.getenv("OPENWEATHER_API_KEY")
+
+@st.cache_resource(show_spinner=False)
+def get_weather_fetcher():
+    """Shared WeatherFetcher built from the process-wide API key."""
+    return WeatherFetcher(get_weather_api_key())
+
+@st.cache_resource(show_spinner=False)
+def get_weather_str_formatter():
+    """Memoized weather string formatter shared across reruns, keyed on the weather values."""
+    weather_fetcher = get_weather_fetcher()
+    
+    @functools.lru_cache(maxsize=256)
+    def format_weather(weather_items, stadium_name):
+        return weather_fetcher.format_weather_string_with_stadium(dict(weather_items), stadium_name)
+    
+    return format_weather
+
+def format_weather_str(weather, stadium_name):
+    """Format weather for display, skipping the work when the same conditions were formatted before."""
+    if not weather:
+        return "Weather data unavailable"
+    return get_weather_str_formatter()(tuple(weather.items()), stadium_name)
+
+GAMES_CACHE_TTL = 30  # Refresh game data every 30 seconds
+
+@st.cache_resource(show_spinner=False)
+def get_games_cache():
+    """Process-wide (timestamp, games) cache; plain dict so cache hits skip pickling."""
+    return {}
 
-@st.cache_data(ttl=30, show_spinner=False)  # Cache game data for 30 seconds
 def get_games_data_only():
-    """Get only MLB game data with frequent updates for live scores."""
+    """
+    Get only MLB game data with frequent updates for live scores.
+    Returns None if the fetch failed; failures are not cached so the next call retries.
+    """
+    cache = get_games_cache()
+    now = time.time()
+    entry = cache.get('games')
+    if entry and now - entry[0] < GAMES_CACHE_TTL:
+        return entry[1]
+    
     try:
-        mlb_fetcher = MLBGameFetcher()
+        mlb_fetcher = get_mlb_fetcher()
         games = mlb_fetcher.get_todays_games()
-        return games
     except Exception as e:
-        st.error(f"Error fetching game data: {e}")
-        return []
-
-@st.cache_data(ttl=1800, show_spinner=False)  # Cache weather data for 30 minutes
-def get_weather_data_for_game(game_pk, coordinates, game_datetime, stadium_name, game_status, weather_api_key):
-    """Get weather data for a specific game, but only if game is not finished."""
-    # Don't fetch new weather for finished games
-    if game_status in ["Final", "Game Over"]:
+        # Runs on the background refresh thread too, so log rather than write to a page
+        print(f"Error fetching game data: {e}")
         return None
     
-    if not coordinates:
-        return None
-        
+    if games is not None:
+        cache['games'] = (now, games)
+    return games
+
+@st.cache_data(ttl=1800, show_spinner=False)  # Cache weather data for 30 minutes
+def get_weather_data_for_live_games(game_requests, weather_api_key):
+    """
+    Get weather data for all live games in one batch.
+    game_requests is a tuple of (coordinates, game_datetime, stadium_name, game_status) tuples;
+    games at the same stadium share a single One Call request.
+    """
     try:
         if weather_api_key:
-            weather_fetcher = WeatherFetcher(weather_api_key)
-            weather = weather_fetcher.get_weather_for_game(
-                coordinates, 
-                game_datetime,
-                stadium_name,
-                game_status)
-        else:
-            # Use mock weather data if no API key
-            weather = get_mock_weather(stadium_name, game_status)
+            weather_fetcher = get_weather_fetcher()
+            return weather_fetcher.get_weather_for_games(list(game_requests))
         
-        return weather
+        # Use mock weather data if no API key
+        return [get_mock_weather(stadium_name, game_status) if coordinates else None
+                for coordinates, _, stadium_name, game_status in game_requests]
     except Exception as e:
-        print(f"Error fetching weather for game {game_pk}: {e}")
-        return None
+        print(f"Error fetching weather for live games: {e}")
+        return [None] * len(game_requests)
+
+FINAL_WEATHER_CACHE_DIR = os.path.join(tempfile.gettempdir(), "mlb_weather")
+
+@st.cache_resource(show_spinner=False)
+def get_final_weather_disk_cache():
+    """On-disk store of final-game weather keyed by game_pk, with no expiry."""
+    return diskcache.Cache(FINAL_WEATHER_CACHE_DIR)
 
-@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour since this is for finished games
-def get_weather_data_for_finished_game(game_pk, coordinates, game_datetime, stadium_name, weather_api_key):
-    """Get current weather data for a finished game and mark it as final conditions."""
+def get_weather_data_for_finished_game(game_pk, coordinates, stadium_name, weather_api_key):
+    """
+    Get current weather data for a finished game and mark it as final conditions.
+    Called only on a miss in the shared weather store, which keeps the result.
+    Stored per game_pk; games at the same park share one request via WeatherFetcher's payload cache.
+    """
     if not coordinates:
         return None
         
     try:
         if weather_api_key:
-            weather_fetcher = WeatherFetcher(weather_api_key)
+            # Final conditions never change, so reuse them across restarts and days
+            disk_cache = get_final_weather_disk_cache()
+            weather = disk_cache.get(game_pk)
+            if weather:
+                return weather
+            
+            weather_fetcher = get_weather_fetcher()
             # Get current weather conditions at the stadium
             weather = weather_fetcher.get_weather_for_game(
                 coordinates, 
@@ -272,6 +178,7 @@ def get_weather_data_for_finished_game(game_pk, coordinates, game_datetime, stad
             if weather:
                 # Update the weather time description to indicate these are final conditions
                 weather['weather_time'] = "conditions at game end"
+                disk_cache[game_pk] = weather
         else:
             # Use mock weather data if no API key
             weather = get_mock_weather(stadium_name, "Final")
@@ -281,43 +188,39 @@ def get_weather_data_for_finished_game(game_pk, coordinates, game_datetime, stad
         print(f"Error fetching final weather for game {game_pk}: {e}")
         return None
 
-def get_stored_final_weather(game_pk):
-    """Get stored weather data for finished games."""
-    if 'final_weather_cache' not in st.session_state:
-        st.session_state.final_weather_cache = {}
-    
-    return st.session_state.final_weather_cache.get(game_pk)
+@st.cache_resource(show_spinner=False)
+def get_weather_store():
+    """
+    Process-wide stored weather keyed by (kind, game_pk), shared by every session and bounded to a day.
+    Entries stay per game because doubleheader games need their own forecast hour and end-of-game
+    conditions; same-park network dedupe is left to WeatherFetcher's One Call payload cache.
+    """
+    return cachetools.TTLCache(maxsize=512, ttl=24 * 3600), threading.Lock()
 
-def store_final_weather(game_pk, weather_data):
-    """Store weather data for a game that just finished."""
-    if 'final_weather_cache' not in st.session_state:
-        st.session_state.final_weather_cache = {}
-    
-    st.session_state.final_weather_cache[game_pk] = weather_data
-
-def get_stored_scheduled_weather(game_pk):
-    """Get stored weather forecast for scheduled games."""
-    if 'scheduled_weather_cache' not in st.session_state:
-        st.session_state.scheduled_weather_cache = {}
-    
-    return st.session_state.scheduled_weather_cache.get(game_pk)
+def get_stored_weather(kind, game_pk):
+    """Get stored weather for a game; kind is 'final' or 'scheduled'."""
+    store, lock = get_weather_store()
+    with lock:
+        return store.get((kind, game_pk))
 
-def store_scheduled_weather(game_pk, weather_data):
-    """Store weather forecast for a scheduled game."""
-    if 'scheduled_weather_cache' not in st.session_state:
-        st.session_state.scheduled_weather_cache = {}
-    
-    st.session_state.scheduled_weather_cache[game_pk] = weather_data
+def store_weather(kind, game_pk, weather_data):
+    """Store weather for a game; kind is 'final' or 'scheduled'."""
+    store, lock = get_weather_store()
+    with lock:
+        store[(kind, game_pk)] = weather_data
 
-@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour for scheduled games
 def get_weather_forecast_for_scheduled_game(game_pk, coordinates, game_datetime, stadium_name, weather_api_key):
-    """Get weather forecast for a scheduled game (fetch once and store)."""
+    """
+    Get weather forecast for a scheduled game (fetch once and store).
+    Called only on a miss in the shared weather store, which keeps the result.
+    Stored per game_pk; games at the same park share one request via WeatherFetcher's payload cache.
+    """
     if not coordinates:
         return None
         
     try:
         if weather_api_key:
-            weather_fetcher = WeatherFetcher(weather_api_key)
+            weather_fetcher = get_weather_fetcher()
             # Get forecast for game time
             weather = weather_fetcher.get_weather_for_game(
                 coordinates, 
@@ -337,176 +240,344 @@ def get_weather_forecast_for_scheduled_game(game_pk, coordinates, game_datetime,
         print(f"Error fetching forecast for scheduled game {game_pk}: {e}")
         return None
 
+@st.cache_resource(show_spinner=False)
+def get_games_state():
+    """Process-wide stale-while-revalidate state for the assembled games payload."""
+    return {
+        'lock': threading.Lock(),
+        'payload': None,
+        'generated_at': 0.0,
+        'fresh_until': 0.0,
+        'inflight': None,  # threading.Event of the running refresh, set when it finishes
+    }
+
 def get_games_data():
-    """Get complete games data with appropriate caching for games and weather."""
+    """
+    Get complete games data, serving the last payload immediately once it goes stale
+    and rebuilding it in a background thread. Only the very first (cold) load blocks,
+    and concurrent cold callers wait on a single build.
+    The result is shared by every session without copying, so callers must treat it as read-only.
+    Returns None only if no payload has ever been built successfully.
+    """
+    state = get_games_state()
+    with state['lock']:
+        payload = state['payload']
+        if payload is not None and time.time() < state['fresh_until']:
+            return payload
+        # Only one refresh at a time, however many sessions see the stale or missing payload
+        refresh_done = state['inflight']
+        start_refresh = refresh_done is None
+        if start_refresh:
+            refresh_done = state['inflight'] = threading.Event()
+    
+    if payload is None:
+        # Cold start: build inline, or wait for the build another session started
+        if start_refresh:
+            refresh_games_data(state, refresh_done)
+        else:
+            refresh_done.wait()
+        with state['lock']:
+            return state['payload']
+    
+    if start_refresh:
+        refresh_thread = threading.Thread(target=refresh_games_data, args=(state, refresh_done), daemon=True)
+        add_script_run_ctx(refresh_thread)
+        refresh_thread.start()
+    return payload
+
+def refresh_games_data(state, refresh_done):
+    """
+    Rebuild the games payload and publish it to the shared state.
+    A failed build keeps the last good payload and schedules a quick retry.
+    """
+    try:
+        payload = build_games_data()
+        now = time.time()
+        with state['lock']:
+            if payload is not None:
+                state['payload'] = payload
+                state['generated_at'] = now
+                # Only hold a real slate through quiet hours; an empty one is re-checked soon
+                games, _ = payload
+                state['fresh_until'] = now + (get_cache_ttl() if games else GAMES_CACHE_TTL)
+            else:
+                state['fresh_until'] = now + GAMES_CACHE_TTL
+    finally:
+        # Only the refresh that took the in-flight slot releases it
+        with state['lock']:
+            if state['inflight'] is refresh_done:
+                state['inflight'] = None
+        refresh_done.set()
+
+def build_games_data():
+    """
+    Get complete games data with appropriate caching for games and weather.
+    Returns (games, using_mock_data), or None if the build failed.
+    """
     try:
         # Get fresh game data (30 second cache)
         games = get_games_data_only()
+        if games is None:
+            return None
         
         # Initialize weather components
-        weather_api_key = st.secrets.get("OPENWEATHER_API_KEY", None)
-        weather_fetcher = WeatherFetcher(weather_api_key)
+        weather_api_key = get_weather_api_key()
+        
+        # Without an API key everything is mock data - skip the stored/fetched weather paths
+        if weather_api_key is None:
+            mock_games = []
+            for game in games:
+                game = dict(game)
+                weather = get_mock_weather(game['stadium_name'], game['status']) if game['coordinates'] else None
+                game['weather'] = weather
+                game['weather_str'] = format_weather_str(weather, game['stadium_name'])
+                mock_games.append(game)
+            return mock_games, True
         
-        # Process each game
+        # First pass: reuse stored weather and collect the fetches still needed
         games_with_weather = []
+        pending = []  # (game, fetch function, args, stored weather kind)
+        live_games = []
         for game in games:
+            # Copy so weather fields don't leak into the shared games cache
+            game = dict(game)
             game_pk = game.get('game_pk')
+            weather = None
             
             # Handle weather data based on game status
-            if game['status'] in ["Final", "Game Over"]:
+            if game['status'] in FINAL_STATUSES:
                 # Try to get stored weather for finished games
-                weather = get_stored_final_weather(game_pk)
+                weather = get_stored_weather('final', game_pk)
                 if not weather and game['coordinates']:
                     # If no stored weather, fetch current conditions and store them
                     # This handles cases where the app starts after a game has already finished
-                    weather = get_weather_data_for_finished_game(
+                    pending.append((game, get_weather_data_for_finished_game, (
                         game_pk,
                         game['coordinates'],
-                        game['game_datetime'],
                         game['stadium_name'],
                         weather_api_key
-                    )
-                    if weather:
-                        store_final_weather(game_pk, weather)
-                    else:
-                        # Only use mock data as absolute last resort
-                        weather = get_mock_weather(game['stadium_name'], game['status'])
-            elif game['status'] in ["In Progress", "Live"]:
-                # For live games, get fresh weather data every 30 minutes
-                weather = get_weather_data_for_game(
-                    game_pk,
-                    game['coordinates'],
-                    game['game_datetime'],
-                    game['stadium_name'],
-                    game['status'],
-                    weather_api_key
-                )
+                    ), 'final'))
+            elif game['status'] in LIVE_STATUSES:
+                # For live games, get fresh weather data every 30 minutes (batched below)
+                live_games.append(game)
             else:
                 # For scheduled games, fetch forecast once and store it
-                weather = get_stored_scheduled_weather(game_pk)
+                weather = get_stored_weather('scheduled', game_pk)
                 if not weather and game['coordinates']:
-                    # Fetch forecast for game time (only once)
-                    weather = get_weather_forecast_for_scheduled_game(
+                    pending.append((game, get_weather_forecast_for_scheduled_game, (
                         game_pk,
                         game['coordinates'],
                         game['game_datetime'],
                         game['stadium_name'],
                         weather_api_key
-                    )
-                    if weather:
-                        store_scheduled_weather(game_pk, weather)
-                    else:
-                        # Use mock data as fallback
-                        weather = get_mock_weather(game['stadium_name'], game['status'])
-            
-            # If game just finished, store its weather data
-            if game['status'] in ["Final", "Game Over"] and weather:
-                store_final_weather(game_pk, weather)
+                    ), 'scheduled'))
             
-            # Format weather string
             game['weather'] = weather
-            if weather:
-                game['weather_str'] = weather_fetcher.format_weather_string_with_stadium(
-                    weather, game['stadium_name'])
-            else:
-                game['weather_str'] = "Weather data unavailable"
-            
             games_with_weather.append(game)
         
-        return games_with_weather, weather_api_key is None
+        # Fetch all missing weather concurrently - each call is network-bound
+        if pending or live_games:
+            live_requests = tuple(
+                (game['coordinates'], game['game_datetime'], game['stadium_name'], game['status'])
+                for game in live_games
+            )
+            # Worker threads need the script context to use Streamlit's caches
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(max_workers=16, initializer=add_script_run_ctx,
+                                    initargs=(None, ctx)) as executor:
+                live_future = executor.submit(get_weather_data_for_live_games, live_requests, weather_api_key)
+                results = list(executor.map(lambda task: task[1](*task[2]), pending))
+                live_weather = live_future.result()
+            
+            for game, weather in zip(live_games, live_weather):
+                game['weather'] = weather
+            
+            for (game, _, _, kind), weather in zip(pending, results):
+                if weather:
+                    store_weather(kind, game['game_pk'], weather)
+                else:
+                    # Only use mock data as absolute last resort
+                    weather = get_mock_weather(game['stadium_name'], game['status'])
+                game['weather'] = weather
+        
+        # Format weather strings
+        for game in games_with_weather:
+            game['weather_str'] = format_weather_str(game['weather'], game['stadium_name'])
+        
+        return games_with_weather, False
         
     except Exception as e:
-        st.error(f"Error fetching data: {e}")
-        return [], True
+        # May run on the background refresh thread, so log rather than write to a page
+        print(f"Error fetching data: {e}")
+        return None
 
-@st.cache_data(ttl=1800, show_spinner=False)
 def get_cache_timestamp():
-    """Get cache timestamp for display purposes in Eastern Time."""
-    eastern_tz = timezone(timedelta(hours=-4))  # EDT
-    eastern_time = datetime.now(eastern_tz)
-    return eastern_time.strftime("%I:%M:%S %p")
-
-def track_user_activity():
-    """Track user activity to prevent unnecessary cache refreshes."""
-    # This function runs every time a user loads the page
-    # The cache will only refresh when this function is called (i.e., when users are active)
-    if 'last_activity' not in st.session_state:
-        st.session_state.last_activity = datetime.now()
-    else:
-        st.session_state.last_activity = datetime.now()
-    return True
+    """Get the time the games payload was last built, for display in Eastern Time."""
+    generated_at = get_games_state()['generated_at']
+    if not generated_at:
+        return "not yet loaded"
+    return datetime.fromtimestamp(generated_at, EASTERN).strftime("%I:%M:%S %p")
+
+# (card_class, time_class) for each game status; anything not listed is styled as scheduled
+SCHEDULED_STYLE = ("game-card scheduled-game", "")
+STATUS_STYLES = {
+    **{status: ("game-card live-game", "live-indicator") for status in LIVE_STATUSES},
+    **{status: ("game-card final-game", "") for status in FINAL_STATUSES},
+    'Delayed': ("game-card delayed-game", ""),
+}
+
+# Complete game card markup - no indentation so markdown keeps it as raw HTML
+GAME_CARD_TEMPLATE = '''<div class="{card_class}">
+<div class="card-row">
+<div class="left">{{teams_display}}</div>
+<div class="right"><span class="{time_class}">{{game_time}}</span></div>
+</div>
+<div class="stadium-info">🏟️ <strong>{{stadium_name}}</strong> | 📊 {{status}}</div>
+{{home_runs_html}}
+<div class="weather-info">🌤️ <strong>Weather:</strong> {{weather_str}}</div>
+</div>'''
+
+def specialize_card_template(card_class, time_class):
+    """Pre-fill the status styling so each card only formats its per-game fields."""
+    return GAME_CARD_TEMPLATE.format(
+        card_class=card_class,
+        time_class=f"{time_class} game-time" if time_class else "game-time",
+    )
+
+SCHEDULED_CARD_TEMPLATE = specialize_card_template(*SCHEDULED_STYLE)
+STATUS_CARD_TEMPLATES = {status: specialize_card_template(*style) for status, style in STATUS_STYLES.items()}
+
+def format_home_run_detail(batter, inning, distance):
+    """Format a single home run as 'Batter (Inning N) - D ft'."""
+    detail = f"{batter} (Inning {inning})"
+    return f"{detail} - {distance} ft" if distance else detail
+
+@st.cache_resource(show_spinner=False)
+def get_home_runs_formatter():
+    """Memoized home run formatter shared across reruns - most polls see an unchanged list."""
+    
+    @functools.lru_cache(maxsize=512)
+    def format_home_runs(home_runs_tuple, away_team_abbr, home_team_abbr):
+        # Split by team in a single pass
+        away_hrs, home_hrs = [], []
+        for team_type, *detail in home_runs_tuple:
+            (away_hrs if team_type == 'away' else home_hrs).append(detail)
+        
+        home_run_text = []
+        if away_hrs:
+            # Use fallback if abbreviation is empty
+            team_name = away_team_abbr if away_team_abbr else "Away"
+            home_run_text.append(f"<strong>{team_name}:</strong> " + ", ".join(
+                [format_home_run_detail(*detail) for detail in away_hrs]))
+        
+        if home_hrs:
+            # Use fallback if abbreviation is empty
+            team_name = home_team_abbr if home_team_abbr else "Home"
+            home_run_text.append(f"<strong>{team_name}:</strong> " + ", ".join(
+                [format_home_run_detail(*detail) for detail in home_hrs]))
+        
+        return " | ".join(home_run_text)
+    
+    return format_home_runs
 
 def format_home_runs_display(home_runs, away_team_abbr, home_team_abbr):
     """Format home run information for display as HTML."""
     if not home_runs:
         return "No home runs hit yet"
     
-    home_run_text = []
-    away_hrs = [hr for hr in home_runs if hr['team_type'] == 'away']
-    home_hrs = [hr for hr in home_runs if hr['team_type'] == 'home']
-    
-    if away_hrs:
-        # Use fallback if abbreviation is empty
-        team_name = away_team_abbr if away_team_abbr else "Away"
-        away_text = f"<strong>{team_name}:</strong> "
-        away_details = []
-        for hr in away_hrs:
-            detail = f"{hr['batter']} (Inning {hr['inning']})"
-            if hr['distance']:
-                detail += f" - {hr['distance']} ft"
-            away_details.append(detail)
-        away_text += ", ".join(away_details)
-        home_run_text.append(away_text)
-    
-    if home_hrs:
-        # Use fallback if abbreviation is empty
-        team_name = home_team_abbr if home_team_abbr else "Home"
-        home_text = f"<strong>{team_name}:</strong> "
-        home_details = []
-        for hr in home_hrs:
-            detail = f"{hr['batter']} (Inning {hr['inning']})"
-            if hr['distance']:
-                detail += f" - {hr['distance']} ft"
-            home_details.append(detail)
-        home_text += ", ".join(home_details)
-        home_run_text.append(home_text)
-    
-    return " | ".join(home_run_text)
+    home_runs_tuple = tuple(
+        (hr['team_type'], hr['batter'], hr['inning'], hr['distance']) for hr in home_runs
+    )
+    return get_home_runs_formatter()(home_runs_tuple, away_team_abbr, home_team_abbr)
 
-def main():
-    """Main Streamlit application."""
-    
-    # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>⚾ MLB Weather Widget</h1>
-        <p>Today's games with comprehensive weather analysis and home run tracking</p>
-    </div>
-    """, unsafe_allow_html=True)
+@st.cache_resource(show_spinner=False)
+def get_rendered_cards():
+    """Process-wide holder for the last rendered card HTML and the games list it came from."""
+    return {'last': (None, "")}
+
+def build_game_cards_html(games):
+    """Build the HTML for every game card as one block."""
+    html_parts = []
+    for game in games:
+        # Card template already styled for this status
+        card_template = STATUS_CARD_TEMPLATES.get(game['status'], SCHEDULED_CARD_TEMPLATE)
+        
+        # Build complete game card content in a single markdown block
+        score_info = game.get('score_info', '')
+        
+        # Team names and score
+        teams_display = f'<div class="team-names">{game["away_team"]} @ {game["home_team"]}</div>'
+        if score_info:
+            if "Final:" in score_info:
+                teams_display += f'<span class="final-score">{score_info}</span>'
+            else:
+                teams_display += f'<span class="score">{score_info}</span>'
+        
+        # Home runs information
+        home_runs = game.get('home_runs', ())
+        home_runs_html = ""
+        if home_runs:
+            hr_display = format_home_runs_display(
+                home_runs, game['away_team_abbr'], game['home_team_abbr'])
+            home_runs_html = f'<div class="home-runs-info">⚾ <strong>Home Runs ({len(home_runs)}):</strong><br>{hr_display}</div>'
+        elif game['status'] in STARTED_STATUSES:
+            home_runs_html = '<div class="home-runs-info">⚾ <strong>Home Runs:</strong> None hit yet</div>'
+        
+        card_fields = {
+            'teams_display': teams_display,
+            'game_time': game['game_time'],
+            'stadium_name': game['stadium_name'],
+            'status': game['status'],
+            'home_runs_html': home_runs_html,
+            'weather_str': game['weather_str'],
+        }
+        html_parts.append(card_template.format_map(card_fields))
     
+    return "\n".join(html_parts)
+
+def render_games(games):
+    """Render the game cards, reusing the HTML built for the same games payload."""
+    # The games payload is only replaced when it is rebuilt, so reuse the HTML until then
+    rendered = get_rendered_cards()
+    rendered_games, cards_html = rendered['last']
+    if rendered_games is not games:
+        cards_html = build_game_cards_html(games)
+        rendered['last'] = (games, cards_html)
+    
+    # Render the whole list at once
+    st.markdown(cards_html, unsafe_allow_html=True)
+
+@st.experimental_fragment(run_every=GAMES_CACHE_TTL)
+def render_dashboard():
+    """
+    Render everything drawn from the games payload - cache status, metrics, cards and footer.
+    Re-runs on its own at the games refresh interval without rerunning the page, so a stale
+    payload served while the background rebuild runs is replaced on the next tick.
+    """
     # Date and cache info
     col1, col2 = st.columns([2, 1])
     with col1:
         # Display date in Eastern Time
-        eastern_tz = timezone(timedelta(hours=-4))  # EDT
-        today_eastern = datetime.now(eastern_tz)
+        today_eastern = datetime.now(EASTERN)
         today_str = today_eastern.strftime("%A, %B %d, %Y")
         st.subheader(f"📅 {today_str}")
     
+    # Get data
+    with st.spinner("Loading games and weather data..."):
+        games_payload = get_games_data()
+    if games_payload is None:
+        st.error("Error fetching game data. Retrying shortly.")
+        return
+    games, using_mock_data = games_payload
+    
     with col2:
-        # Show cache status
+        # Show cache status - filled in after loading so it reflects the payload being shown;
+        # this is the only place the timestamp is read, the footer doesn't show it
         cache_time = get_cache_timestamp()
         st.caption(f"🕐 Data cached at: {cache_time}")
         st.caption("⏱️ Games: 30s | Weather: Smart")
         st.caption("📅 Scheduled: Forecast once | 🔴 Live: 30min")
     
-    # Track user activity (prevents cache refresh when no users are active)
-    track_user_activity()
-    
-    # Get data
-    with st.spinner("Loading games and weather data..."):
-        games, using_mock_data = get_games_data()
-    
     # API key warning
     if using_mock_data:
         st.warning("""
@@ -521,10 +592,15 @@ def main():
         return
     
     # Summary metrics
-    live_games = len([g for g in games if g['status'] in ['In Progress', 'Live']])
-    final_games = len([g for g in games if g['status'] in ['Final', 'Game Over']])
+    live_games = final_games = total_home_runs = 0
+    for game in games:
+        status = game['status']
+        if status in LIVE_STATUSES:
+            live_games += 1
+        elif status in FINAL_STATUSES:
+            final_games += 1
+        total_home_runs += len(game.get('home_runs', ()))
     upcoming_games = len(games) - live_games - final_games
-    total_home_runs = sum(len(game.get('home_runs', [])) for game in games)
     
     st.markdown('<div class="metrics-container">', unsafe_allow_html=True)
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -543,77 +619,10 @@ def main():
     st.markdown("---")
     
     # Display games
-    for i, game in enumerate(games, 1):
-        # Determine card style based on status
-        if game['status'] in ['In Progress', 'Live']:
-            card_class = "game-card live-game"
-            time_class = "live-indicator"
-        elif game['status'] in ['Final', 'Game Over']:
-            card_class = "game-card final-game"
-            time_class = ""
-        elif game['status'] == 'Delayed':
-            card_class = "game-card delayed-game"
-            time_class = ""
-        else:
-            card_class = "game-card scheduled-game"
-            time_class = ""
-        
-        # Build complete game card content in a single markdown block
-        score_info = game.get('score_info', '')
-        
-        # Team names and score
-        teams_display = f'<div class="team-names">{game["away_team"]} @ {game["home_team"]}</div>'
-        if score_info:
-            if "Final:" in score_info:
-                teams_display += f'<span class="final-score">{score_info}</span>'
-            else:
-                teams_display += f'<span class="score">{score_info}</span>'
-        
-        # Game time
-        if time_class:
-            time_display = f'<span class="{time_class} game-time">{game["game_time"]}</span>'
-        else:
-            time_display = f'<span class="game-time">{game["game_time"]}</span>'
-        
-        # Stadium and status
-        stadium_info = f'<div class="stadium-info">🏟️ <strong>{game["stadium_name"]}</strong> | 📊 {game["status"]}</div>'
-        
-        # Home runs information
-        home_runs = game.get('home_runs', [])
-        home_runs_html = ""
-        if home_runs:
-            hr_display = format_home_runs_display(
-                home_runs, 
-                game.get('away_team_abbr', game['away_team'][:3]), 
-                game.get('home_team_abbr', game['home_team'][:3])
-            )
-            home_runs_html = f'<div class="home-runs-info">⚾ <strong>Home Runs ({len(home_runs)}):</strong><br>{hr_display}</div>'
-        elif game['status'] in ["In Progress", "Live", "Final", "Game Over"]:
-            home_runs_html = '<div class="home-runs-info">⚾ <strong>Home Runs:</strong> None hit yet</div>'
-        
-        # Weather information
-        weather_html = ""
-        if game['weather_str']:
-            weather_html = f'<div class="weather-info">🌤️ <strong>Weather:</strong> {game["weather_str"]}</div>'
-        else:
-            weather_html = '<div class="weather-info">🌤️ <strong>Weather:</strong> Weather data unavailable</div>'
-        
-        # Combine everything into a single markdown block - no indentation
-        complete_card_html = f'''<div class="{card_class}">
-<div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem;">
-<div style="flex: 1;">{teams_display}</div>
-<div style="text-align: right;">{time_display}</div>
-</div>
-{stadium_info}
-{home_runs_html}
-{weather_html}
-</div>'''
-        
-        st.markdown(complete_card_html, unsafe_allow_html=True)
+    render_games(games)
     
     # Footer with cache information
     st.markdown("---")
-    cache_time = get_cache_timestamp()
     st.markdown(f"""
     <div class="footer-info">
         <p><strong>📊 Game Summary:</strong> {len(games)} total games | {total_home_runs} home runs hit today</p>
@@ -624,6 +633,20 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+def main():
+    """Main Streamlit application."""
+    
+    # Header
+    st.markdown("""
+    <div class="main-header">
+        <h1>⚾ MLB Weather Widget</h1>
+        <p>Today's games with comprehensive weather analysis and home run tracking</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Everything below the header follows the games payload
+    render_dashboard()
+
 if __name__ == "__main__":
     main()
 
@@ -3,14 +3,116 @@ Weather API module for fetching weather data.
 Uses OpenWeatherMap's One Call API 3.0.
 """
 
+import bisect
+import functools
+import logging
+import threading
+import time
+import orjson
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from stadium_coords import get_stadium_orientation
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=64)
+def _title_case(description):
+    """Title-case a weather description; OpenWeather only uses a few dozen of them."""
+    return description.title()
+
+def _parse_game_datetime(game_datetime):
+    """Parse an ISO game time string once; returns an aware datetime or None."""
+    if not game_datetime:
+        return None
+    try:
+        return datetime.fromisoformat(game_datetime.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+# Wind direction relative to the field, one entry per 45° slice clockwise from center field
+_WIND_BUCKETS = (
+    "out to center field",
+    "out to right field",
+    "out to right field foul territory",
+    "in from right field",
+    "in from center field",
+    "in from left field",
+    "out to left field foul territory",
+    "out to left field",
+)
+
+# Display labels by threshold: label i applies from thresholds[i - 1] up to thresholds[i]
+_DEW_POINT_THRESHOLDS = (55, 60, 65, 70)  # °F
+_DEW_POINT_LABELS = ("dry", "comfortable", "sticky", "uncomfortable", "oppressive")
+_WIND_IMPACT_THRESHOLDS = (5, 10, 15)  # mph
+_WIND_IMPACT_LABELS = (
+    " (calm)",
+    " (light breeze)",
+    " (moderate, noticeable effect on ball flight)",
+    " (strong, affects fly balls significantly)",
+)
+# UV is only shown from the first threshold up, so its labels start at "high"
+_UV_THRESHOLDS = (6, 8, 11)
+_UV_LABELS = ("high", "very high", "extreme")
+
+# Stadium elevations in feet for station pressure; most other stadiums are near sea level (0-200 ft)
+_STADIUM_ELEVATIONS = {
+    'Coors Field': 5200,
+    'Chase Field': 1100,
+    'Kauffman Stadium': 750,
+    'Globe Life Field': 550,
+    'Minute Maid Park': 50,
+    'Tropicana Field': 10,
+}
+
+# Carry baseline on neutral days for high altitude stadiums (ft)
+_ALTITUDE_BASELINES = {
+    'Coors Field': 22.0,
+    'Chase Field': 4.0,  # Moderate altitude
+}
+
+# Standard baseline conditions (sea level)
+_STANDARD_TEMP = 70  # °F
+_STANDARD_PRESSURE_SL = 29.92  # inHg at sea level
+_STANDARD_HUMIDITY = 50  # %
+_HPA_TO_INHG = 0.02953
+
+# Carry multiplier per field-relative wind direction (ft per mph)
+_WIND_EFFECT_FACTORS = {
+    "out to center field": 2.0,  # Direct tailwind - full effect
+    "in from center field": -1.8,  # Direct headwind - full negative effect
+    "out to right field": 1.5,  # Quartering tailwind - partial effect (75%)
+    "out to left field": 1.5,
+    # Foul-territory winds still blow outward and have always used the quartering factor
+    "out to right field foul territory": 1.5,
+    "out to left field foul territory": 1.5,
+    "in from right field": -1.3,  # Quartering headwind - partial negative effect (75%)
+    "in from left field": -1.3,
+}
 
 class WeatherFetcher:
     def __init__(self, api_key=None):
         self.api_key = api_key
         self.base_url = "https://api.openweathermap.org/data/3.0"
+        
+        # Keep-alive connections to OpenWeather, shared by the concurrent stadium fetches.
+        # Transient 5xx responses are retried on the pooled connection with a short backoff;
+        # 401/429 are not, and a Retry-After header is ignored so a fetch never sleeps on it.
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                        raise_on_status=False, respect_retry_after_header=False)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retries))
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+        
+        # Raw One Call payloads keyed by rounded (lat, lon) -> (fetched_at, data)
+        self._onecall_cache = {}
+        self._onecall_cache_ttl = 600  # 10 minutes
+        # Requests currently in flight, keyed the same way, so concurrent misses share one
+        self._onecall_inflight = {}
+        self._onecall_lock = threading.Lock()
     
     def get_weather_for_game(self, coordinates, game_datetime, stadium_name=None, game_status="Scheduled"):
         """
@@ -27,9 +129,86 @@ class WeatherFetcher:
         """
         if not coordinates or not self.api_key:
             return None
+        
+        data = self._fetch_onecall(coordinates)
+        if data is None:
+            return None
+        
+        return self._parse_onecall_data(data, _parse_game_datetime(game_datetime), stadium_name, game_status)
+    
+    def get_weather_for_games(self, game_requests):
+        """
+        Get weather for several games at once.
+        Each stadium's One Call payload is fetched once (doubleheaders share it),
+        and the distinct stadiums are fetched concurrently.
+        
+        Args:
+            game_requests: List of (coordinates, game_datetime, stadium_name, game_status) tuples
             
+        Returns:
+            List of weather dictionaries (or None) in the same order as game_requests
+        """
+        if not self.api_key:
+            return [None] * len(game_requests)
+        
+        unique_coordinates = list({coords for coords, _, _, _ in game_requests if coords})
+        payloads = {}
+        if unique_coordinates:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                payloads = dict(zip(unique_coordinates, executor.map(self._fetch_onecall, unique_coordinates)))
+        
+        # One clock read for the whole batch
+        now_utc = datetime.now(timezone.utc)
+        results = []
+        for coordinates, game_datetime, stadium_name, game_status in game_requests:
+            data = payloads.get(coordinates)
+            if data is None:
+                results.append(None)
+            else:
+                results.append(self._parse_onecall_data(
+                    data, _parse_game_datetime(game_datetime), stadium_name, game_status, now_utc))
+        return results
+    
+    def _fetch_onecall(self, coordinates):
+        """
+        Fetch the raw One Call API 3.0 payload for a location.
+        Payloads are reused for 10 minutes, so every game at a stadium shares one request,
+        and concurrent callers for the same stadium wait on a single in-flight request.
+        Returns the decoded JSON dictionary or None if error.
+        """
         lat, lon = coordinates
+        cache_key = (round(lat, 2), round(lon, 2))
+        
+        with self._onecall_lock:
+            cached = self._onecall_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self._onecall_cache_ttl:
+                return cached[1]
+            inflight = self._onecall_inflight.get(cache_key)
+            if inflight is None:
+                inflight = self._onecall_inflight[cache_key] = Future()
+                is_owner = True
+            else:
+                is_owner = False
+        
+        if not is_owner:
+            return inflight.result()
         
+        data = None
+        try:
+            data = self._request_onecall(lat, lon)
+            if data is not None:
+                self._onecall_cache[cache_key] = (time.monotonic(), data)
+            return data
+        finally:
+            with self._onecall_lock:
+                del self._onecall_inflight[cache_key]
+            inflight.set_result(data)
+    
+    def _request_onecall(self, lat, lon):
+        """
+        Request the One Call API 3.0 payload for a location.
+        Returns the decoded JSON dictionary or None if error.
+        """
         try:
             # Use One Call API 3.0 for comprehensive weather data
             url = f"{self.base_url}/onecall"
@@ -41,64 +220,67 @@ class WeatherFetcher:
                 'exclude': 'minutely,alerts'  # Exclude unnecessary data
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             # Handle specific HTTP errors
             if response.status_code == 401:
-                print(f"Weather API Error 401: Invalid API key or subscription issue.")
+                logger.warning("Weather API Error 401: Invalid API key or subscription issue.")
                 return None
             elif response.status_code == 429:
-                print(f"Weather API Error 429: Rate limit exceeded.")
+                logger.warning("Weather API Error 429: Rate limit exceeded.")
                 return None
             
             response.raise_for_status()
-            data = response.json()
-            
-            return self._parse_onecall_data(data, game_datetime, stadium_name, game_status)
+            return orjson.loads(response.content)
             
         except requests.RequestException as e:
-            print(f"Error fetching weather data: {e}")
+            logger.warning("Error fetching weather data: %s", e)
             return None
-        except json.JSONDecodeError as e:
-            print(f"Error parsing weather data: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Error parsing weather data: %s", e)
             return None
     
-    def _parse_onecall_data(self, data, game_datetime, stadium_name=None, game_status="Scheduled"):
+    def _parse_onecall_data(self, data, game_dt, stadium_name=None, game_status="Scheduled", now_utc=None):
         """
         Parse weather data from One Call API 3.0 response.
         Try to find the best weather data for game time.
+        game_dt is the already-parsed game start (or None); now_utc defaults to the current time.
         """
         try:
             # Determine if we should use current weather or forecast
-            weather_data = self._get_appropriate_weather_data(data, game_datetime, game_status)
+            weather_data = self._get_appropriate_weather_data(data, game_dt, game_status, now_utc)
             
             if not weather_data:
                 return None
             
-            weather = weather_data.get('weather', [{}])[0]
+            # Bind the lookup once - every field below comes from this dict
+            get = weather_data.get
+            weather = get('weather', [{}])[0]
             
             # Get wind data
-            wind_speed = weather_data.get('wind_speed', 0)
-            wind_deg = weather_data.get('wind_deg', 0)
+            wind_speed = get('wind_speed', 0)
+            wind_deg = get('wind_deg', 0)
             
             # Calculate wind direction relative to ballpark
             wind_direction_text = self._get_wind_direction_for_stadium(wind_deg, stadium_name)
             
             # Get precipitation data
-            rain = weather_data.get('rain', {}).get('1h', 0) if 'rain' in weather_data else 0
-            snow = weather_data.get('snow', {}).get('1h', 0) if 'snow' in weather_data else 0
+            rain = get('rain', {}).get('1h', 0)
+            snow = get('snow', {}).get('1h', 0)
             
             # Get precipitation probability
-            precip_chance = weather_data.get('pop', 0) * 100 if 'pop' in weather_data else 0
+            precip_chance = get('pop', 0) * 100
             if precip_chance == 0 and (rain > 0 or snow > 0):
                 # Fallback calculation
                 precip_chance = min(100, max(20, (rain + snow) * 10))
             
+            dew_point = get('dew_point')
+            
             return {
-                'temperature': round(weather_data.get('temp', 0)),
-                'feels_like': round(weather_data.get('feels_like', 0)),
-                'humidity': weather_data.get('humidity', 0),
-                'description': weather.get('description', 'Unknown').title(),
+                'temperature': round(get('temp', 0)),
+                'feels_like': round(get('feels_like', 0)),
+                'humidity': get('humidity', 0),
+                'description': _title_case(weather.get('description', 'Unknown')),
                 'main_condition': weather.get('main', 'Unknown'),
                 'wind_speed': round(wind_speed),
                 'wind_direction': wind_deg,
@@ -106,29 +288,23 @@ class WeatherFetcher:
                 'precipitation_chance': round(precip_chance),
                 'rain_mm': rain,
                 'snow_mm': snow,
-                'pressure': weather_data.get('pressure'),  # Atmospheric pressure (hPa)
-                'visibility': weather_data.get('visibility'),  # Visibility in meters
-                'uv_index': weather_data.get('uvi'),  # UV index
-                'dew_point': round(weather_data.get('dew_point', 0)) if weather_data.get('dew_point') else None,
-                'weather_time': self._get_weather_time_description(game_datetime, game_status)
+                'pressure': get('pressure'),  # Atmospheric pressure (hPa)
+                'visibility': get('visibility'),  # Visibility in meters
+                'uv_index': get('uvi'),  # UV index
+                'dew_point': round(dew_point) if dew_point else None,
+                'weather_time': self._get_weather_time_description(game_dt, game_status)
             }
             
         except Exception as e:
-            print(f"Error parsing One Call weather data: {e}")
+            logger.warning("Error parsing One Call weather data: %s", e, exc_info=True)
             return None
     
-    def _get_appropriate_weather_data(self, data, game_datetime, game_status):
+    def _get_appropriate_weather_data(self, data, game_dt, game_status, now_utc=None):
         """
         Get the appropriate weather data based on game status and timing.
         """
         try:
-            # Parse game datetime
-            if game_datetime:
-                game_dt = datetime.fromisoformat(game_datetime.replace('Z', '+00:00'))
-            else:
-                game_dt = None
-            
-            current_dt = datetime.now(timezone.utc)
+            current_dt = now_utc or datetime.now(timezone.utc)
             
             # Determine which weather data to use based on game status
             if game_status in ["In Progress", "Live", "Final", "Game Over"]:
@@ -139,21 +315,16 @@ class WeatherFetcher:
                 hours_until_game = (game_dt - current_dt).total_seconds() / 3600
                 
                 if hours_until_game <= 48 and 'hourly' in data:
-                    # Find the closest hourly forecast to game time
+                    # Find the closest hourly forecast to game time - entries are sorted by dt
                     hourly_data = data['hourly']
-                    best_forecast = None
-                    min_time_diff = float('inf')
-                    
-                    for hour_data in hourly_data:
-                        forecast_dt = datetime.fromtimestamp(hour_data['dt'], tz=timezone.utc)
-                        time_diff = abs((forecast_dt - game_dt).total_seconds())
-                        
-                        if time_diff < min_time_diff:
-                            min_time_diff = time_diff
-                            best_forecast = hour_data
-                    
-                    if best_forecast:
-                        return best_forecast
+                    if hourly_data:
+                        game_ts = game_dt.timestamp()
+                        forecast_times = [hour_data['dt'] for hour_data in hourly_data]
+                        i = bisect.bisect_left(forecast_times, game_ts)
+                        if i == len(forecast_times) or (
+                                i > 0 and game_ts - forecast_times[i - 1] <= forecast_times[i] - game_ts):
+                            i -= 1
+                        return hourly_data[i]
                 
                 # Fallback to current weather if no suitable forecast found
                 return data.get('current', {})
@@ -162,7 +333,7 @@ class WeatherFetcher:
                 return data.get('current', {})
                 
         except Exception as e:
-            print(f"Error determining appropriate weather data: {e}")
+            logger.warning("Error determining appropriate weather data: %s", e, exc_info=True)
             return data.get('current', {})
     
     def _get_wind_direction_for_stadium(self, wind_deg, stadium_name):
@@ -172,9 +343,6 @@ class WeatherFetcher:
         if not stadium_name or wind_deg is None:
             return self._degrees_to_cardinal(wind_deg) if wind_deg is not None else "Unknown"
         
-        # Import here to avoid circular imports
-        from stadium_coords import get_stadium_orientation
-        
         # Get stadium orientation (default to 90 degrees if not found)
         stadium_bearing = get_stadium_orientation(stadium_name)
         if stadium_bearing is None:
@@ -184,25 +352,8 @@ class WeatherFetcher:
         # Wind direction is "from" direction, so we need to adjust
         relative_angle = (wind_deg - stadium_bearing + 360) % 360
         
-        # Determine wind direction relative to field
-        if 337.5 <= relative_angle or relative_angle < 22.5:
-            return "out to center field"
-        elif 22.5 <= relative_angle < 67.5:
-            return "out to right field"
-        elif 67.5 <= relative_angle < 112.5:
-            return "out to right field foul territory"
-        elif 112.5 <= relative_angle < 157.5:
-            return "in from right field"
-        elif 157.5 <= relative_angle < 202.5:
-            return "in from center field"
-        elif 202.5 <= relative_angle < 247.5:
-            return "in from left field"
-        elif 247.5 <= relative_angle < 292.5:
-            return "out to left field foul territory"
-        elif 292.5 <= relative_angle < 337.5:
-            return "out to left field"
-        else:
-            return self._degrees_to_cardinal(wind_deg)
+        # Determine wind direction relative to field - eight 45° slices centred on center field
+        return _WIND_BUCKETS[int((relative_angle + 22.5) // 45) % 8]
     
     def _degrees_to_cardinal(self, degrees):
         """Convert wind degrees to cardinal direction."""
@@ -228,27 +379,12 @@ class WeatherFetcher:
             return None
         
         # Get stadium elevation for station pressure calculation
-        stadium_elevations = {
-            'Coors Field': 5200,  # feet
-            'Chase Field': 1100,
-            'Kauffman Stadium': 750,
-            'Globe Life Field': 550,
-            'Minute Maid Park': 50,
-            'Tropicana Field': 10,
-            # Most other stadiums are near sea level (0-200 ft)
-        }
-        
-        elevation = stadium_elevations.get(stadium_name, 0)
-        
-        # Standard baseline conditions (sea level)
-        STANDARD_TEMP = 70  # °F
-        STANDARD_PRESSURE_SL = 29.92  # inHg at sea level
-        STANDARD_HUMIDITY = 50  # %
+        elevation = _STADIUM_ELEVATIONS.get(stadium_name, 0)
         
         # Get current conditions
-        temp_f = weather_data.get('temperature', STANDARD_TEMP)
+        temp_f = weather_data.get('temperature', _STANDARD_TEMP)
         pressure_hpa = weather_data.get('pressure')
-        humidity = weather_data.get('humidity', STANDARD_HUMIDITY)
+        humidity = weather_data.get('humidity', _STANDARD_HUMIDITY)
         wind_speed = weather_data.get('wind_speed', 0)
         wind_direction_text = weather_data.get('wind_direction_text', '')
         
@@ -256,7 +392,7 @@ class WeatherFetcher:
         # Weather APIs typically provide altimeter pressure (sea-level corrected), not station pressure
         if elevation > 500:  # For significant elevation, calculate true station pressure
             # Standard atmosphere model for station pressure at elevation
-            station_pressure_inhg = STANDARD_PRESSURE_SL * (1 - 0.0000068756 * elevation) ** 5.2559
+            station_pressure_inhg = _STANDARD_PRESSURE_SL * (1 - 0.0000068756 * elevation) ** 5.2559
             
             # Adjust for temperature deviation from standard (59°F at sea level)
             standard_temp_at_elevation = 59 - (elevation * 0.00356)  # Standard lapse rate
@@ -265,54 +401,32 @@ class WeatherFetcher:
         else:
             # For low elevation stadiums, use the provided pressure (likely close to station pressure)
             if pressure_hpa:
-                station_pressure_inhg = pressure_hpa * 0.02953
+                station_pressure_inhg = pressure_hpa * _HPA_TO_INHG
             else:
-                station_pressure_inhg = STANDARD_PRESSURE_SL
-        
-        # Use stadium-specific approach for high altitude vs sea level
-        if stadium_name == 'Coors Field':
-            # Fixed altitude baseline for Coors Field on neutral days: +22 ft
-            altitude_baseline = 22.0
-            
-            # Add temperature effect: +2.5 ft per 10°F above 70°F
-            temp_effect = ((temp_f - STANDARD_TEMP) / 10.0) * 2.5
-            
-            # Add humidity effect: +1.2 ft per 10% above 50% (humid air less dense)
-            humidity_effect = ((humidity - STANDARD_HUMIDITY) / 10.0) * 1.2
-            
-            # Wind effect
-            wind_effect = self._calculate_wind_vector_effect(wind_speed, wind_direction_text, stadium_name)
-            
-            # Humidor effect
-            humidor_effect = self._calculate_humidor_effect(temp_f, humidity)
-            
-            total_carry_difference = altitude_baseline + temp_effect + humidity_effect + wind_effect + humidor_effect
-            
-        elif stadium_name == 'Chase Field':
-            # Moderate altitude baseline for Chase Field: +4 ft
-            altitude_baseline = 4.0
-            temp_effect = ((temp_f - STANDARD_TEMP) / 10.0) * 2.5
-            humidity_effect = ((humidity - STANDARD_HUMIDITY) / 10.0) * 1.2
-            wind_effect = self._calculate_wind_vector_effect(wind_speed, wind_direction_text, stadium_name)
-            humidor_effect = self._calculate_humidor_effect(temp_f, humidity)
-            total_carry_difference = altitude_baseline + temp_effect + humidity_effect + wind_effect + humidor_effect
-            
+                station_pressure_inhg = _STANDARD_PRESSURE_SL
+        
+        # Effects shared by every stadium
+        # Temperature effect: +2.5 ft per 10°F above 70°F
+        temp_effect = ((temp_f - _STANDARD_TEMP) / 10.0) * 2.5
+        # Humidity effect: +1.2 ft per 10% above 50% (humid air less dense)
+        humidity_effect = ((humidity - _STANDARD_HUMIDITY) / 10.0) * 1.2
+        wind_effect = self._calculate_wind_vector_effect(wind_speed, wind_direction_text, stadium_name)
+        humidor_effect = self._calculate_humidor_effect(temp_f, humidity)
+        
+        # High altitude stadiums use a fixed baseline; sea level stadiums use a simple pressure effect
+        altitude_baseline = _ALTITUDE_BASELINES.get(stadium_name)
+        if altitude_baseline is not None:
+            pressure_effect = 0
         else:
-            # Sea level stadiums - use weather effects only
-            temp_effect = ((temp_f - STANDARD_TEMP) / 10.0) * 2.5
-            humidity_effect = ((humidity - STANDARD_HUMIDITY) / 10.0) * 1.2
-            
-            # For sea level, use simple pressure effect
+            altitude_baseline = 0.0
             if pressure_hpa:
-                pressure_inhg = pressure_hpa * 0.02953
-                pressure_effect = (STANDARD_PRESSURE_SL - pressure_inhg) * 5.0  # Conservative pressure effect
+                pressure_inhg = pressure_hpa * _HPA_TO_INHG
+                pressure_effect = (_STANDARD_PRESSURE_SL - pressure_inhg) * 5.0  # Conservative pressure effect
             else:
                 pressure_effect = 0
-            
-            wind_effect = self._calculate_wind_vector_effect(wind_speed, wind_direction_text, stadium_name)
-            humidor_effect = self._calculate_humidor_effect(temp_f, humidity)
-            
-            total_carry_difference = temp_effect + humidity_effect + pressure_effect + wind_effect + humidor_effect
+        
+        total_carry_difference = (altitude_baseline + temp_effect + humidity_effect + pressure_effect
+                                  + wind_effect + humidor_effect)
         
         # Create description
         if total_carry_difference >= 20:
@@ -333,11 +447,11 @@ class WeatherFetcher:
         return {
             'carry_difference': round(total_carry_difference, 1),
             'description': description,
-            'temp_effect': round(temp_effect, 1) if 'temp_effect' in locals() else 0,
-            'humidity_effect': round(humidity_effect, 1) if 'humidity_effect' in locals() else 0,
+            'temp_effect': round(temp_effect, 1),
+            'humidity_effect': round(humidity_effect, 1),
             'wind_effect': round(wind_effect, 1),
             'humidor_effect': round(humidor_effect, 1),
-            'altitude_baseline': round(altitude_baseline, 1) if 'altitude_baseline' in locals() else 0,
+            'altitude_baseline': round(altitude_baseline, 1),
             'station_pressure': round(station_pressure_inhg, 2)
         }
     
@@ -351,24 +465,8 @@ class WeatherFetcher:
         # Typical home run spray patterns (degrees from center field)
         # Most HRs are pulled: LH batters to LF (-30°), RH batters to RF (+30°)
         # Use average of typical spray angles
-        
-        wind_effect = 0
-        
-        if 'out to center' in wind_direction_text.lower():
-            # Direct tailwind - full effect
-            wind_effect = wind_speed * 2.0
-        elif 'in from center' in wind_direction_text.lower():
-            # Direct headwind - full negative effect
-            wind_effect = wind_speed * -1.8
-        elif 'out to left' in wind_direction_text.lower() or 'out to right' in wind_direction_text.lower():
-            # Quartering tailwind - partial effect (75%)
-            wind_effect = wind_speed * 1.5
-        elif 'in from left' in wind_direction_text.lower() or 'in from right' in wind_direction_text.lower():
-            # Quartering headwind - partial negative effect (75%)
-            wind_effect = wind_speed * -1.3
-        elif 'foul territory' in wind_direction_text.lower():
-            # Cross wind - minimal effect (25%)
-            wind_effect = wind_speed * 0.25
+        # Cardinal fallbacks ("from NNE") are not field-relative and get no effect
+        wind_effect = wind_speed * _WIND_EFFECT_FACTORS.get(wind_direction_text, 0)
         
         # Reduce effect for very light winds
         if wind_speed < 8:
@@ -394,7 +492,7 @@ class WeatherFetcher:
         
         return temp_ball_effect + humidity_ball_effect
     
-    def _get_weather_time_description(self, game_datetime, game_status):
+    def _get_weather_time_description(self, game_dt, game_status):
         """
         Get a description of when the weather data applies.
         """
@@ -402,15 +500,10 @@ class WeatherFetcher:
             return "current conditions"
         elif game_status in ["Final", "Game Over"]:
             return "conditions during game"
+        elif game_dt:
+            return f"forecast for game time ({game_dt.strftime('%I:%M %p')})"
         else:
-            try:
-                if game_datetime:
-                    game_dt = datetime.fromisoformat(game_datetime.replace('Z', '+00:00'))
-                    return f"forecast for game time ({game_dt.strftime('%I:%M %p')})"
-                else:
-                    return "forecast for game time"
-            except:
-                return "forecast for game time"
+            return "forecast for game time"
     
     def format_weather_string(self, weather_data):
         """
@@ -447,57 +540,35 @@ class WeatherFetcher:
         # Humidity and dew point (important for ball flight and comfort)
         if dew_point:
             # Add dew point context for baseball conditions
-            if dew_point >= 70:
-                humidity_desc = f"{humidity}% humidity (oppressive, dew point {dew_point}°F)"
-            elif dew_point >= 65:
-                humidity_desc = f"{humidity}% humidity (uncomfortable, dew point {dew_point}°F)"
-            elif dew_point >= 60:
-                humidity_desc = f"{humidity}% humidity (sticky, dew point {dew_point}°F)"
-            elif dew_point >= 55:
-                humidity_desc = f"{humidity}% humidity (comfortable, dew point {dew_point}°F)"
-            else:
-                humidity_desc = f"{humidity}% humidity (dry, dew point {dew_point}°F)"
-            weather_parts.append(humidity_desc)
+            dew_desc = _DEW_POINT_LABELS[bisect.bisect_right(_DEW_POINT_THRESHOLDS, dew_point)]
+            weather_parts.append(f"{humidity}% humidity ({dew_desc}, dew point {dew_point}°F)")
         else:
             weather_parts.append(f"{humidity}% humidity")
         
         # Wind (critical for baseball) with impact assessment
-        if wind >= 15:
-            wind_impact = " (strong, affects fly balls significantly)"
-        elif wind >= 10:
-            wind_impact = " (moderate, noticeable effect on ball flight)"
-        elif wind >= 5:
-            wind_impact = " (light breeze)"
-        else:
-            wind_impact = " (calm)"
+        wind_impact = _WIND_IMPACT_LABELS[bisect.bisect_right(_WIND_IMPACT_THRESHOLDS, wind)]
         weather_parts.append(f"{wind} mph winds {wind_dir}{wind_impact}")
         
         # Add pressure info if available (affects ball flight)
         pressure = weather_data.get('pressure')
         if pressure:
             # Convert hPa to inHg for US audience
-            pressure_inhg = pressure * 0.02953
+            pressure_inhg = pressure * _HPA_TO_INHG
+            pressure_desc = f"{pressure_inhg:.2f} inHg"
             # Add context for baseball (higher pressure = less ball carry)
             if pressure_inhg > 30.20:
-                pressure_desc = f"{pressure_inhg:.2f} inHg (high pressure, less ball carry)"
+                pressure_desc += " (high pressure, less ball carry)"
             elif pressure_inhg < 29.80:
-                pressure_desc = f"{pressure_inhg:.2f} inHg (low pressure, more ball carry)"
-            else:
-                pressure_desc = f"{pressure_inhg:.2f} inHg"
+                pressure_desc += " (low pressure, more ball carry)"
             weather_parts.append(pressure_desc)
         
         # Visibility removed - doesn't affect ball carry
         
         # Add UV index if significant (day games)
         uv_index = weather_data.get('uv_index')
-        if uv_index and uv_index >= 6:
-            if uv_index >= 11:
-                uv_desc = f"UV index {uv_index} (extreme)"
-            elif uv_index >= 8:
-                uv_desc = f"UV index {uv_index} (very high)"
-            elif uv_index >= 6:
-                uv_desc = f"UV index {uv_index} (high)"
-            weather_parts.append(uv_desc)
+        if uv_index and uv_index >= _UV_THRESHOLDS[0]:
+            uv_desc = _UV_LABELS[bisect.bisect_right(_UV_THRESHOLDS, uv_index) - 1]
+            weather_parts.append(f"UV index {uv_index} ({uv_desc})")
         
         return ", ".join(weather_parts)
     
@@ -531,13 +602,15 @@ class WeatherFetcher:
         
         return base_weather
 
+# Shared keyless fetcher whose helper methods the mock data reuses
+_MOCK_FETCHER = WeatherFetcher()
+
 # Mock weather data for testing when API key is not available
 def get_mock_weather(stadium_name=None, game_status="Scheduled"):
     """
     Return mock weather data for testing purposes with comprehensive baseball-relevant parameters.
     """
-    # Create a WeatherFetcher instance to use its methods
-    fetcher = WeatherFetcher()
+    fetcher = _MOCK_FETCHER
     wind_deg = 180
     wind_direction_text = fetcher._get_wind_direction_for_stadium(wind_deg, stadium_name)
     weather_time = fetcher._get_weather_time_description(None, game_status)